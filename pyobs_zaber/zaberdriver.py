@@ -1,22 +1,33 @@
-from contextlib import asynccontextmanager
-from typing import Any
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
 
-from zaber_motion import Units
+import serial
+from zaber_motion import ConnectionClosedException, ConnectionFailedException, Units
 from zaber_motion.ascii import Connection, Axis, Device
 
+# how long a position read from the motor is re-used, in seconds
+POSITION_CACHE_TTL = 0.05
 
-@asynccontextmanager
-async def zaber_device(port) -> Device:
-    async with Connection.open_serial_port_async(port) as connection:
-        await connection.enable_alerts_async()
-        devices = await connection.detect_devices_async()
-        yield devices[0]
+# number of attempts and initial delay in seconds for reconnecting after the connection was lost
+RECONNECT_ATTEMPTS = 4
+RECONNECT_DELAY = 0.5
 
+T = TypeVar("T")
 
-@asynccontextmanager
-async def zaber_axis(port) -> Axis:
-    async with zaber_device(port) as device:
-        yield device.get_axis(1)
+
+def set_low_latency(port: str) -> None:
+    """Set ASYNC_LOW_LATENCY on the serial port, so that short messages are not delayed by the USB-serial bridge.
+
+    The flag persists on the tty until the device is removed, so the port can be closed again afterwards.
+    Only logs a warning on platforms that do not support it.
+    """
+    try:
+        with serial.Serial(port) as s:
+            s.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+        logging.warning("Could not enable low latency mode on %s: %s", port, e)
 
 
 class ZaberDriver:
@@ -51,12 +62,129 @@ class ZaberDriver:
         self.acceleration_unit = acceleration_unit
         self.system_led = system_led
 
+        # persistent connection, opened in open()
+        self._connection: Optional[Connection] = None
+        self._device: Optional[Device] = None
+        self._axis: Optional[Axis] = None
+        self._device_id: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+        # last position read as (time, position)
+        self._position_cache: Optional[Tuple[float, float]] = None
+
     async def open(self) -> None:
-        await self.enable_led(self.system_led)
+        """Open connection to motor and keep it for all further commands."""
+        async with self._lock:
+            if self._connection is not None:
+                logging.warning("Connection to motor already open.")
+                return
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """Open connection and detect device, must be called with lock held."""
+        await asyncio.to_thread(set_low_latency, self.port)
+        self._connection = await Connection.open_serial_port_async(self.port)
+        try:
+            await self._setup_device()
+        except Exception:
+            # do not keep a half-open port
+            await self._close_connection()
+            raise
+
+    async def _setup_device(self) -> None:
+        """Detect device on open connection and configure it."""
+        await self._connection.enable_alerts_async()
+        devices = await self._connection.detect_devices_async()
+        self._device = devices[0]
+        self._axis = self._device.get_axis(1)
+
+        # make sure, it's still the same device
+        device_id = self._device.device_id
+        if self._device_id is not None and device_id != self._device_id:
+            logging.warning("Device ID changed from %d to %d.", self._device_id, device_id)
+        self._device_id = device_id
+
+        await self._device.settings.set_async("system.led.enable", float(self.system_led))
+
+    async def _reconnect(self) -> None:
+        """Reconnect after the connection was lost, with exponential backoff, must be called with lock held."""
+        self._invalidate_position()
+
+        # release old connection
+        await self._close_connection()
+
+        delay = RECONNECT_DELAY
+        for attempt in range(RECONNECT_ATTEMPTS):
+            try:
+                await self._connect()
+                return
+            except Exception as e:
+                if attempt == RECONNECT_ATTEMPTS - 1:
+                    raise
+                logging.warning("Could not reconnect to motor, retrying in %.1fs: %s", delay, e)
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _close_connection(self) -> None:
+        """Close connection, ignoring any errors, must be called with lock held."""
+        if self._connection is not None:
+            try:
+                await self._connection.close_async()
+            except Exception as e:
+                logging.debug("Error while closing connection to motor: %s", e)
+        self._connection = None
+        self._device = None
+        self._axis = None
+
+    async def _command(self, func: Callable[[], Awaitable[T]], retry: bool = True) -> T:
+        """Run a command on the device and reconnect once if the connection was lost, must be called with lock held.
+
+        Both a closed connection and a link failing during the request trigger the reconnect. If there is no
+        connection, e.g. because an earlier reconnect gave up, a new one is opened first, so the driver recovers once
+        the motor is available again.
+
+        Args:
+            func: function sending the command
+            retry: whether to send the command again after reconnecting, must be False for non-idempotent commands
+        """
+        if self._connection is None:
+            await self._reconnect()
+
+        try:
+            return await func()
+        except (ConnectionClosedException, ConnectionFailedException):
+            logging.warning("Connection to motor lost, reconnecting...")
+            await self._reconnect()
+            if not retry:
+                raise
+            return await func()
+
+    async def close(self) -> None:
+        """Close connection to motor."""
+        async with self._lock:
+            await self._close_connection()
+            self._invalidate_position()
+
+    def _invalidate_position(self) -> None:
+        """Discard cached position, e.g. after the motor moved."""
+        self._position_cache = None
+
+    @property
+    def axis(self) -> Axis:
+        if self._axis is None:
+            raise ValueError("No connection to motor.")
+        return self._axis
+
+    @property
+    def device(self) -> Device:
+        if self._device is None:
+            raise ValueError("No connection to motor.")
+        return self._device
 
     async def home(self) -> None:
-        async with zaber_axis(self.port) as axis:
-            await axis.home_async()
+        async with self._lock:
+            self._invalidate_position()
+            await self._command(lambda: self.axis.home_async())
 
     async def move_by(self, length, speed=None) -> None:
         """
@@ -69,22 +197,33 @@ class ZaberDriver:
             speed = self.speed
 
         # move
-        async with zaber_axis(self.port) as axis:
-            await axis.move_relative_async(
-                length,
-                self.length_unit,
-                velocity=speed,
-                velocity_unit=self.speed_unit,
-                acceleration=self.acceleration,
-                acceleration_unit=self.acceleration_unit,
+        async with self._lock:
+            self._invalidate_position()
+            # relative moves must not be sent twice
+            await self._command(
+                lambda: self.axis.move_relative_async(
+                    length,
+                    self.length_unit,
+                    velocity=speed,
+                    velocity_unit=self.speed_unit,
+                    acceleration=self.acceleration,
+                    acceleration_unit=self.acceleration_unit,
+                ),
+                retry=False,
             )
 
     async def get_position(self) -> float:
         """
-        Get the current position of the Zaber motor.
+        Get the current position of the Zaber motor. Reads within a short time are served from a cache.
         """
-        async with zaber_axis(self.port) as axis:
-            return await axis.get_position_async(unit=self.length_unit)
+        async with self._lock:
+            if self._position_cache is not None:
+                ts, position = self._position_cache
+                if time.monotonic() - ts < POSITION_CACHE_TTL:
+                    return position
+            position = await self._command(lambda: self.axis.get_position_async(unit=self.length_unit))
+            self._position_cache = (time.monotonic(), position)
+            return position
 
     async def move_to(self, position) -> None:
         """
@@ -92,14 +231,17 @@ class ZaberDriver:
         Args:
             position: value to which the motor moves
         """
-        async with zaber_axis(self.port) as axis:
-            await axis.move_absolute_async(
-                position,
-                self.length_unit,
-                velocity=self.speed,
-                velocity_unit=self.speed_unit,
-                acceleration=self.acceleration,
-                acceleration_unit=self.acceleration_unit,
+        async with self._lock:
+            self._invalidate_position()
+            await self._command(
+                lambda: self.axis.move_absolute_async(
+                    position,
+                    self.length_unit,
+                    velocity=self.speed,
+                    velocity_unit=self.speed_unit,
+                    acceleration=self.acceleration,
+                    acceleration_unit=self.acceleration_unit,
+                )
             )
 
     async def enable_led(self, status: bool) -> None:
@@ -108,10 +250,12 @@ class ZaberDriver:
         Args:
             status: True -> LED on, False -> LED off
         """
-        async with zaber_device(self.port) as device:
-            device.settings.set("system.led.enable", float(status))
+        self.system_led = status
+        async with self._lock:
+            await self._command(lambda: self.device.settings.set_async("system.led.enable", float(status)))
 
     async def stop(self):
         """Stop motion."""
-        async with zaber_axis(self.port) as axis:
-            await axis.stop_async()
+        # do not wait for the lock, which is held by a running move
+        self._invalidate_position()
+        await self.axis.stop_async()
@@ -31,15 +31,30 @@ class ZaberModeSelector(Module, IMode, IMotion):
 
         self.driver = ZaberDriver(**kwargs)
         self.modes = modes
+        self._mode_names = tuple(modes.keys())
         self.current_mode = 'undefined'
 
+    async def open(self) -> None:
+        """Open module."""
+        await Module.open(self)
+
+        # connect to motor
+        await self.driver.open()
+
+    async def close(self) -> None:
+        """Close module."""
+        await Module.close(self)
+
+        # disconnect from motor
+        await self.driver.close()
+
     async def list_modes(self, **kwargs: Any) -> List[str]:
         """List available modes.
 
         Returns:
             List of available modes.
         """
-        return list(self.modes.keys())
+        return list(self._mode_names)
 
     async def set_mode(self, mode: str, **kwargs) -> None:
         """Set the current mode.
@@ -51,8 +66,7 @@ class ZaberModeSelector(Module, IMode, IMotion):
             ValueError: If an invalid mode was given.
             MoveError: If mode selector cannot be moved.
         """
-        available_modes = await self.list_modes()
-        if mode in available_modes:
+        if mode in self._mode_names:
             if self.current_mode == mode:
                 logging.info("Mode %s already selected.", mode)
             else:
@@ -61,7 +75,7 @@ class ZaberModeSelector(Module, IMode, IMotion):
                 logging.info("Mode %s ready.", mode)
                 self.current_mode = mode
         else:
-            logging.warning("Unknown mode %s. Available modes are: %s", mode, available_modes)
+            logging.warning("Unknown mode %s. Available modes are: %s", mode, self._mode_names)
 
     async def get_mode(self, **kwargs: Any) -> str:
         """Get currently set mode.